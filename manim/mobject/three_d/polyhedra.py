@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Hashable
+import copy
+from collections.abc import Hashable, Sequence
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -15,7 +16,7 @@ from manim.utils.qhull import QuickHull
 
 if TYPE_CHECKING:
     from manim.mobject.mobject import Mobject
-    from manim.typing import Point3D, Point3DLike_Array
+    from manim.typing import Point3D, Point3D_Array, Point3DLike_Array
 
 __all__ = [
     "Polyhedron",
@@ -26,6 +27,131 @@ __all__ = [
     "ConvexHull3D",
 ]
 
+_DEFAULT_FACES_CONFIG: dict[str, Any] = {"fill_opacity": 0.5, "shade_in_3d": True}
+_DEFAULT_EDGE_CONFIG: dict[str, Any] = {
+    "stroke_opacity": 0,  # I find that having the edges visible makes the polyhedra look weird
+}
+_DEFAULT_GRAPH_CONFIG: dict[str, Any] = {"vertex_type": Dot3D}
+
+# Unit edge length vertex and face tables of the platonic solids
+_TETRA_VERTS = (np.sqrt(2) / 4) * np.array(
+    [
+        [1, 1, 1],
+        [1, -1, -1],
+        [-1, 1, -1],
+        [-1, -1, 1],
+    ],
+    dtype=np.float64,
+)
+_TETRA_FACES = ((0, 1, 2), (3, 0, 2), (0, 1, 3), (3, 1, 2))
+
+_OCTA_VERTS = (np.sqrt(2) / 2) * np.array(
+    [
+        [1, 0, 0],
+        [-1, 0, 0],
+        [0, 1, 0],
+        [0, -1, 0],
+        [0, 0, 1],
+        [0, 0, -1],
+    ],
+    dtype=np.float64,
+)
+_OCTA_FACES = (
+    (2, 4, 1),
+    (0, 4, 2),
+    (4, 3, 0),
+    (1, 3, 4),
+    (3, 5, 0),
+    (1, 5, 3),
+    (2, 5, 1),
+    (0, 5, 2),
+)
+
+_ICOSA_A = (1 + np.sqrt(5)) / 4
+_ICOSA_B = 1 / 2
+_ICOSA_VERTS = np.array(
+    [
+        [0, _ICOSA_B, _ICOSA_A],
+        [0, -_ICOSA_B, _ICOSA_A],
+        [0, _ICOSA_B, -_ICOSA_A],
+        [0, -_ICOSA_B, -_ICOSA_A],
+        [_ICOSA_B, _ICOSA_A, 0],
+        [_ICOSA_B, -_ICOSA_A, 0],
+        [-_ICOSA_B, _ICOSA_A, 0],
+        [-_ICOSA_B, -_ICOSA_A, 0],
+        [_ICOSA_A, 0, _ICOSA_B],
+        [_ICOSA_A, 0, -_ICOSA_B],
+        [-_ICOSA_A, 0, _ICOSA_B],
+        [-_ICOSA_A, 0, -_ICOSA_B],
+    ],
+    dtype=np.float64,
+)
+_ICOSA_FACES = (
+    (1, 8, 0),
+    (1, 5, 7),
+    (8, 5, 1),
+    (7, 3, 5),
+    (5, 9, 3),
+    (8, 9, 5),
+    (3, 2, 9),
+    (9, 4, 2),
+    (8, 4, 9),
+    (0, 4, 8),
+    (6, 4, 0),
+    (6, 2, 4),
+    (11, 2, 6),
+    (3, 11, 2),
+    (0, 6, 10),
+    (10, 1, 0),
+    (10, 7, 1),
+    (11, 7, 3),
+    (10, 11, 7),
+    (10, 11, 6),
+)
+
+_DODECA_A = (1 + np.sqrt(5)) / 4
+_DODECA_B = (3 + np.sqrt(5)) / 4
+_DODECA_C = 1 / 2
+_DODECA_VERTS = np.array(
+    [
+        [_DODECA_A, _DODECA_A, _DODECA_A],
+        [_DODECA_A, _DODECA_A, -_DODECA_A],
+        [_DODECA_A, -_DODECA_A, _DODECA_A],
+        [_DODECA_A, -_DODECA_A, -_DODECA_A],
+        [-_DODECA_A, _DODECA_A, _DODECA_A],
+        [-_DODECA_A, _DODECA_A, -_DODECA_A],
+        [-_DODECA_A, -_DODECA_A, _DODECA_A],
+        [-_DODECA_A, -_DODECA_A, -_DODECA_A],
+        [0, _DODECA_C, _DODECA_B],
+        [0, _DODECA_C, -_DODECA_B],
+        [0, -_DODECA_C, -_DODECA_B],
+        [0, -_DODECA_C, _DODECA_B],
+        [_DODECA_C, _DODECA_B, 0],
+        [-_DODECA_C, _DODECA_B, 0],
+        [_DODECA_C, -_DODECA_B, 0],
+        [-_DODECA_C, -_DODECA_B, 0],
+        [_DODECA_B, 0, _DODECA_C],
+        [-_DODECA_B, 0, _DODECA_C],
+        [_DODECA_B, 0, -_DODECA_C],
+        [-_DODECA_B, 0, -_DODECA_C],
+    ],
+    dtype=np.float64,
+)
+_DODECA_FACES = (
+    (18, 16, 0, 12, 1),
+    (3, 18, 16, 2, 14),
+    (3, 10, 9, 1, 18),
+    (1, 9, 5, 13, 12),
+    (0, 8, 4, 13, 12),
+    (2, 16, 0, 8, 11),
+    (4, 17, 6, 11, 8),
+    (17, 19, 5, 13, 4),
+    (19, 7, 15, 6, 17),
+    (6, 15, 14, 2, 11),
+    (19, 5, 9, 10, 7),
+    (7, 10, 3, 14, 15),
+)
+
 
 class Polyhedron(VGroup):
     """An abstract polyhedra class.
@@ -36,14 +162,18 @@ class Polyhedron(VGroup):
     Parameters
     ----------
     vertex_coords
-        A list of coordinates of the corresponding vertices in the polyhedron. Each coordinate will correspond to
-        a vertex. The vertices are indexed with the usual indexing of Python.
+        A list (or an array of shape ``(N, 3)``) of coordinates of the corresponding vertices in the polyhedron.
+        Each coordinate will correspond to a vertex. The vertices are indexed with the usual indexing of Python.
     faces_list
         A list of faces. Each face is a sublist containing the indices of the vertices that form the corners of that face.
     faces_config
         Configuration for the polygons representing the faces of the polyhedron.
     graph_config
         Configuration for the graph containing the vertices and edges of the polyhedron.
+    include_graph
+        Whether to create the graph containing the vertices and edges of the polyhedron.
+        Without the graph, the :attr:`graph` attribute is ``None`` and the faces
+        are not updated, which is cheaper for static polyhedra.
 
     Examples
     --------
@@ -98,67 +228,197 @@ class Polyhedron(VGroup):
     def __init__(
         self,
         vertex_coords: Point3DLike_Array,
-        faces_list: list[list[int]],
+        faces_list: Sequence[Sequence[int]],
         faces_config: dict[str, str | int | float | bool] = {},
         graph_config: dict[str, Any] = {},
+        include_graph: bool = True,
     ):
         super().__init__()
-        self.faces_config = dict(
-            {"fill_opacity": 0.5, "shade_in_3d": True}, **faces_config
-        )
-        self.graph_config = dict(
-            {
-                "vertex_type": Dot3D,
-                "edge_config": {
-                    "stroke_opacity": 0,  # I find that having the edges visible makes the polyhedra look weird
-                },
-            },
+        self.faces_config = {**_DEFAULT_FACES_CONFIG, **faces_config}
+        # Graph may modify the edge config it is given, so never pass the template
+        self.graph_config = {
+            **_DEFAULT_GRAPH_CONFIG,
+            "edge_config": {**_DEFAULT_EDGE_CONFIG},
             **graph_config,
-        )
-        self.vertex_coords = vertex_coords
+        }
+        self.vertex_coords = np.asarray(vertex_coords, dtype=np.float64)
         self.vertex_indices = list(range(len(self.vertex_coords)))
-        self.layout: dict[Hashable, Any] = dict(enumerate(self.vertex_coords))
+        # Only needed as the layout of the graph; rows of ``vertex_coords`` are
+        # views, so no per-vertex copies are made
+        self.layout: dict[Hashable, Any] = {
+            i: self.vertex_coords[i] for i in self.vertex_indices
+        }
         self.faces_list = faces_list
-        self.face_coords = [[self.layout[j] for j in i] for i in faces_list]
+        self._vertex_keys = list(self.vertex_indices)
+        # Faces are stored as a padded ``(F, k_max + 1, 3)`` array of closed
+        # corner rings: every row is padded by repeating the first corner.
+        num_faces = len(faces_list)
+        self._face_len = np.fromiter(
+            (len(face) for face in faces_list), dtype=np.int32, count=num_faces
+        )
+        k_max = int(self._face_len.max(initial=0))
+        self._uniform_faces = bool(np.all(self._face_len == k_max))
+        padded_idx = np.empty((num_faces, k_max + 1), dtype=np.intp)
+        for row, face in zip(padded_idx, faces_list):
+            row[: len(face)] = face
+            row[len(face) :] = face[0]
+        # Flattened face indices, gathered into ``_face_xyz``
+        self._padded_idx = padded_idx
+        self._face_idx = padded_idx.ravel()
+        self._face_xyz = self._gather_faces(self.vertex_coords)
+        self.face_coords = self._split_faces(self._face_xyz.copy())
         self.edges = self.get_edges(self.faces_list)
         self.faces = self.create_faces(self.face_coords)
-        self.graph = Graph(
-            self.vertex_indices, self.edges, layout=self.layout, **self.graph_config
-        )
-        self.add(self.faces, self.graph)
-        self.add_updater(self.update_faces)
-
-    def get_edges(self, faces_list: list[list[int]]) -> list[tuple[int, int]]:
-        """Creates list of cyclic pairwise tuples."""
-        edges: list[tuple[int, int]] = []
-        for face in faces_list:
-            edges += zip(face, face[1:] + face[:1])
-        return edges
+        self._face_mobs = list(self.faces)
+        # Vertex centers are read into a reusable buffer every frame and
+        # compared against those of the last update (NaN never compares equal)
+        self._centers_buf = np.zeros((len(self._vertex_keys), 3))
+        self._last_centers = np.full((len(self._vertex_keys), 3), np.nan)
+        self.add(self.faces)
+        self.graph: Graph | None = None
+        if include_graph:
+            self.graph = Graph(
+                self.vertex_indices, self.edges, layout=self.layout, **self.graph_config
+            )
+            self.add(self.graph)
+            self.add_updater(self.update_faces)
+
+    def get_edges(self, faces_list: Sequence[Sequence[int]]) -> list[tuple[int, int]]:
+        """Creates list of cyclic pairwise tuples.
+
+        Edges shared between two faces are only listed once, with the
+        smaller vertex index first.
+        """
+        faces = [np.asarray(face, dtype=np.intp) for face in faces_list]
+        if not faces:
+            return []
+        if len({len(face) for face in faces}) == 1:
+            stacked = np.stack(faces)
+            edges = np.stack([stacked, np.roll(stacked, -1, axis=1)], axis=-1)
+        else:
+            edges = np.concatenate(
+                [np.stack([face, np.roll(face, -1)], axis=-1) for face in faces]
+            )
+        unique_edges = np.unique(np.sort(edges.reshape(-1, 2), axis=1), axis=0)
+        return [(a, b) for a, b in unique_edges.tolist()]
 
     def create_faces(
         self,
         face_coords: Point3DLike_Array,
     ) -> VGroup:
-        """Creates VGroup of faces from a list of face coordinates."""
-        face_group = VGroup()
-        for face in face_coords:
-            face_group.add(Polygon(*face, **self.faces_config))
-        return face_group
+        """Creates VGroup of faces from a list of face coordinates.
+
+        This is only called once during initialization; afterwards
+        :meth:`update_faces` moves the corners of these polygons in place.
+        """
+        faces_config = self.faces_config
+        return VGroup(*(Polygon(*face, **faces_config) for face in face_coords))
 
     def update_faces(self, m: Mobject) -> None:
-        face_coords = self.extract_face_coords()
-        new_faces = self.create_faces(face_coords)
-        self.faces.match_points(new_faces)
+        centers = self.get_vertex_centers(self._centers_buf)
+        # Most of the time only the camera moves, so skip static frames
+        if np.array_equal(centers, self._last_centers):
+            return
+        np.copyto(self._last_centers, centers)
+        # Overwrite the corners of the existing faces in place rather than
+        # building a fresh set of polygons on every frame.
+        self._gather_faces(centers, self._face_xyz)
+        for face_mob, ring, length in zip(
+            self._face_mobs, self._face_xyz, self._face_len
+        ):
+            face_mob.set_points_as_corners(ring[: length + 1])
+
+    def get_vertex_centers(self, out: np.ndarray | None = None) -> Point3D_Array:
+        """Returns the current positions of the vertices as an ``(N, 3)`` array.
+
+        These are the centers of the vertices of the graph. Without a graph, the
+        vertex positions are read back from the corners of the faces, so that
+        transformations of the polyhedron are taken into account.
+        If ``out`` is given, the centers are written into it instead of a new array.
+        """
+        if out is None:
+            out = np.empty((len(self._vertex_keys), 3))
+        if self.graph is None:
+            # Vertices that are not part of any face keep their initial position
+            out[:] = self.vertex_coords
+            for face_mob, idx, length in zip(
+                self._face_mobs, self._padded_idx, self._face_len
+            ):
+                out[idx[:length]] = face_mob.get_vertices()
+            return out
+        for i, v in enumerate(self._vertex_keys):
+            out[i] = self.graph[v].get_center()
+        return out
 
     def extract_face_coords(self) -> Point3DLike_Array:
-        """Extracts the coordinates of the vertices in the graph.
-        Used for updating faces.
+        """Extracts the current coordinates of the corners of every face.
+
+        The corners are taken from :meth:`get_vertex_centers`, i.e. from the
+        vertices of the graph, or from the faces themselves without a graph.
         """
-        new_vertex_coords = []
-        for v in self.graph.vertices:
-            new_vertex_coords.append(self.graph[v].get_center())
-        layout = dict(enumerate(new_vertex_coords))
-        return [[layout[j] for j in i] for i in self.faces_list]
+        return self._split_faces(self._gather_faces(self.get_vertex_centers()))
+
+    def _gather_faces(
+        self, centers: Point3D_Array, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Gathers the closed corner rings of all faces into a padded array."""
+        if out is None:
+            out = np.empty((*self._padded_idx.shape, 3))
+        np.take(centers, self._face_idx, axis=0, out=out.reshape(-1, 3))
+        return out
+
+    def _split_faces(self, face_xyz: np.ndarray) -> Point3DLike_Array:
+        if self._uniform_faces:
+            return face_xyz[:, :-1]
+        return [ring[:length] for ring, length in zip(face_xyz, self._face_len)]
+
+
+# Unit sized instances of the platonic solids, see _init_platonic_solid
+_PLATONIC_PROTOTYPES: dict[type[Polyhedron], Polyhedron] = {}
+
+
+def _init_platonic_solid(
+    solid: Polyhedron,
+    solid_class: type[Polyhedron],
+    unit_vertex_coords: Point3D_Array,
+    faces_list: Sequence[Sequence[int]],
+    scale: float,
+    **kwargs: Any,
+) -> None:
+    """Initializes ``solid`` with the vertices ``unit_vertex_coords * scale``.
+
+    If ``solid`` is exactly an instance of ``solid_class`` and no extra configuration
+    is given, a cached unit sized prototype is copied and its vertices are moved into
+    place, which is much cheaper than building the faces and the graph from scratch.
+    Subclasses are always built from scratch, as they may depend on state set up in
+    their own ``__init__``.
+    """
+    if kwargs or type(solid) is not solid_class:
+        Polyhedron.__init__(solid, unit_vertex_coords * scale, faces_list, **kwargs)
+        return
+
+    prototype = _PLATONIC_PROTOTYPES.get(solid_class)
+    if prototype is None:
+        prototype = solid_class.__new__(solid_class)
+        Polyhedron.__init__(prototype, unit_vertex_coords, faces_list)
+        _PLATONIC_PROTOTYPES[solid_class] = prototype
+
+    # Same as Mobject.__deepcopy__, but with solid taking the place of the
+    # prototype so that e.g. the face updater is bound to solid.
+    memo: dict[int, Any] = {id(prototype): solid}
+    attributes = {k: copy.deepcopy(v, memo) for k, v in prototype.__dict__.items()}
+    attributes["original_id"] = str(id(prototype))
+    for k, v in attributes.items():
+        setattr(solid, k, v)
+
+    solid.vertex_coords = unit_vertex_coords * scale
+    solid.layout = {i: solid.vertex_coords[i] for i in solid.vertex_indices}
+    solid.face_coords = solid._split_faces(solid._gather_faces(solid.vertex_coords))
+    assert solid.graph is not None
+    for i, coords in solid.layout.items():
+        solid.graph[i].move_to(coords)
+    solid.graph.update()
+    solid.update_faces(solid)
 
 
 class Tetrahedron(Polyhedron):
@@ -183,16 +443,8 @@ class Tetrahedron(Polyhedron):
     """
 
     def __init__(self, edge_length: float = 1, **kwargs: Any):
-        unit = edge_length * np.sqrt(2) / 4
-        super().__init__(
-            vertex_coords=[
-                np.array([unit, unit, unit]),
-                np.array([unit, -unit, -unit]),
-                np.array([-unit, unit, -unit]),
-                np.array([-unit, -unit, unit]),
-            ],
-            faces_list=[[0, 1, 2], [3, 0, 2], [0, 1, 3], [3, 1, 2]],
-            **kwargs,
+        _init_platonic_solid(
+            self, Tetrahedron, _TETRA_VERTS, _TETRA_FACES, edge_length, **kwargs
         )
 
 
@@ -218,27 +470,8 @@ class Octahedron(Polyhedron):
     """
 
     def __init__(self, edge_length: float = 1, **kwargs: Any):
-        unit = edge_length * np.sqrt(2) / 2
-        super().__init__(
-            vertex_coords=[
-                np.array([unit, 0, 0]),
-                np.array([-unit, 0, 0]),
-                np.array([0, unit, 0]),
-                np.array([0, -unit, 0]),
-                np.array([0, 0, unit]),
-                np.array([0, 0, -unit]),
-            ],
-            faces_list=[
-                [2, 4, 1],
-                [0, 4, 2],
-                [4, 3, 0],
-                [1, 3, 4],
-                [3, 5, 0],
-                [1, 5, 3],
-                [2, 5, 1],
-                [0, 5, 2],
-            ],
-            **kwargs,
+        _init_platonic_solid(
+            self, Octahedron, _OCTA_VERTS, _OCTA_FACES, edge_length, **kwargs
         )
 
 
@@ -264,46 +497,8 @@ class Icosahedron(Polyhedron):
     """
 
     def __init__(self, edge_length: float = 1, **kwargs: Any):
-        unit_a = edge_length * ((1 + np.sqrt(5)) / 4)
-        unit_b = edge_length * (1 / 2)
-        super().__init__(
-            vertex_coords=[
-                np.array([0, unit_b, unit_a]),
-                np.array([0, -unit_b, unit_a]),
-                np.array([0, unit_b, -unit_a]),
-                np.array([0, -unit_b, -unit_a]),
-                np.array([unit_b, unit_a, 0]),
-                np.array([unit_b, -unit_a, 0]),
-                np.array([-unit_b, unit_a, 0]),
-                np.array([-unit_b, -unit_a, 0]),
-                np.array([unit_a, 0, unit_b]),
-                np.array([unit_a, 0, -unit_b]),
-                np.array([-unit_a, 0, unit_b]),
-                np.array([-unit_a, 0, -unit_b]),
-            ],
-            faces_list=[
-                [1, 8, 0],
-                [1, 5, 7],
-                [8, 5, 1],
-                [7, 3, 5],
-                [5, 9, 3],
-                [8, 9, 5],
-                [3, 2, 9],
-                [9, 4, 2],
-                [8, 4, 9],
-                [0, 4, 8],
-                [6, 4, 0],
-                [6, 2, 4],
-                [11, 2, 6],
-                [3, 11, 2],
-                [0, 6, 10],
-                [10, 1, 0],
-                [10, 7, 1],
-                [11, 7, 3],
-                [10, 11, 7],
-                [10, 11, 6],
-            ],
-            **kwargs,
+        _init_platonic_solid(
+            self, Icosahedron, _ICOSA_VERTS, _ICOSA_FACES, edge_length, **kwargs
         )
 
 
@@ -329,50 +524,27 @@ class Dodecahedron(Polyhedron):
     """
 
     def __init__(self, edge_length: float = 1, **kwargs: Any):
-        unit_a = edge_length * ((1 + np.sqrt(5)) / 4)
-        unit_b = edge_length * ((3 + np.sqrt(5)) / 4)
-        unit_c = edge_length * (1 / 2)
-        super().__init__(
-            vertex_coords=[
-                np.array([unit_a, unit_a, unit_a]),
-                np.array([unit_a, unit_a, -unit_a]),
-                np.array([unit_a, -unit_a, unit_a]),
-                np.array([unit_a, -unit_a, -unit_a]),
-                np.array([-unit_a, unit_a, unit_a]),
-                np.array([-unit_a, unit_a, -unit_a]),
-                np.array([-unit_a, -unit_a, unit_a]),
-                np.array([-unit_a, -unit_a, -unit_a]),
-                np.array([0, unit_c, unit_b]),
-                np.array([0, unit_c, -unit_b]),
-                np.array([0, -unit_c, -unit_b]),
-                np.array([0, -unit_c, unit_b]),
-                np.array([unit_c, unit_b, 0]),
-                np.array([-unit_c, unit_b, 0]),
-                np.array([unit_c, -unit_b, 0]),
-                np.array([-unit_c, -unit_b, 0]),
-                np.array([unit_b, 0, unit_c]),
-                np.array([-unit_b, 0, unit_c]),
-                np.array([unit_b, 0, -unit_c]),
-                np.array([-unit_b, 0, -unit_c]),
-            ],
-            faces_list=[
-                [18, 16, 0, 12, 1],
-                [3, 18, 16, 2, 14],
-                [3, 10, 9, 1, 18],
-                [1, 9, 5, 13, 12],
-                [0, 8, 4, 13, 12],
-                [2, 16, 0, 8, 11],
-                [4, 17, 6, 11, 8],
-                [17, 19, 5, 13, 4],
-                [19, 7, 15, 6, 17],
-                [6, 15, 14, 2, 11],
-                [19, 5, 9, 10, 7],
-                [7, 10, 3, 14, 15],
-            ],
-            **kwargs,
+        _init_platonic_solid(
+            self, Dodecahedron, _DODECA_VERTS, _DODECA_FACES, edge_length, **kwargs
         )
 
 
+def _chain_edges(edges: list[list[int]]) -> list[int]:
+    """Orders the edges of a polygon, given in arbitrary order, into a ring of vertex indices."""
+    adjacency: dict[int, list[int]] = {}
+    for a, b in edges:
+        adjacency.setdefault(a, []).append(b)
+        adjacency.setdefault(b, []).append(a)
+    start = min(adjacency)
+    ring = [start]
+    previous, current = start, adjacency[start][0]
+    while current != start:
+        ring.append(current)
+        a, b = adjacency[current]
+        previous, current = current, b if a == previous else a
+    return ring
+
+
 class ConvexHull3D(Polyhedron):
     """A convex hull for a set of points
 
@@ -381,7 +553,8 @@ class ConvexHull3D(Polyhedron):
     points
         The points to consider.
     tolerance
-        The tolerance used for quickhull.
+        The tolerance used for quickhull. Faces whose first three corners form a
+        triangle with a height below the tolerance are discarded as well.
     kwargs
         Forwarded to the parent constructor.
 
@@ -435,23 +608,57 @@ class ConvexHull3D(Polyhedron):
         hull.build(array)
 
         # Setup Lists
-        vertices = []
+        coords: list[np.ndarray] = []
         faces = []
 
         # Extract Faces
-        c = 0
-        d = {}
-        facets = set(hull.facets) - hull.removed
+        # QuickHull creates a separate point object for every subfacet, so points
+        # are identified by the raw bytes of their coordinates. This avoids the
+        # comparatively slow ``__hash__``/``__eq__`` of the point objects.
+        d: dict[bytes, int] = {}
+        # Walk the facets in construction order rather than in set order, which
+        # depends on the hash seed. QuickHull picks its initial simplex at random,
+        # so the order of the faces can still differ between runs.
+        facets = [
+            facet for facet in dict.fromkeys(hull.facets) if facet not in hull.removed
+        ]
         for facet in facets:
-            tmp = set()
+            # Every subfacet is an edge of the facet; chain them into a ring
+            edges = []
             for subfacet in facet.subfacets:
+                edge = []
                 for point in subfacet.points:
-                    if point not in d:
-                        vertices.append(point.coordinates)
-                        d[point] = c
-                        c += 1
-                    tmp.add(point)
-            faces.append([d[point] for point in tmp])
+                    key = point.coordinates.tobytes()
+                    if key not in d:
+                        d[key] = len(coords)
+                        coords.append(point.coordinates)
+                    edge.append(d[key])
+                edges.append(edge)
+            faces.append(_chain_edges(edges))
+        vertices = np.array(coords)
+
+        # Filter and orient all faces at once using their first three corners:
+        # drop degenerate faces and wind the others counterclockwise when seen
+        # from outside the hull
+        facet_normals = np.array([facet.normal for facet in facets]).reshape(-1, 3)
+        keep = np.ones(len(faces), dtype=bool)
+        if faces:
+            v0, v1, v2 = vertices[np.array([face[:3] for face in faces])].transpose(
+                1, 0, 2
+            )
+            normals = np.cross(v1 - v0, v2 - v0)
+            longest_edge = np.linalg.norm(
+                np.stack([v1 - v0, v2 - v1, v0 - v2]), axis=2
+            ).max(axis=0)
+            # The norm of the cross product is the longest edge times the height
+            # of the triangle on it, so this keeps faces higher than ``tolerance``
+            keep = np.linalg.norm(normals, axis=1) > tolerance * longest_edge
+            flip = np.einsum("ij,ij->i", normals, facet_normals) < 0
+            faces = [
+                [face[0], *reversed(face[1:])] if flipped else face
+                for face, kept, flipped in zip(faces, keep, flip)
+                if kept
+            ]
 
         # Call Polyhedron
         super().__init__(
@@ -459,3 +666,4 @@ class ConvexHull3D(Polyhedron):
             faces_list=faces,
             **kwargs,
         )
+        self.face_normals = facet_normals[keep]
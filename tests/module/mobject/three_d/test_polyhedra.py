@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import numpy as np
+
+from manim import (
+    BLUE,
+    RED,
+    ConvexHull3D,
+    Dodecahedron,
+    Icosahedron,
+    Octahedron,
+    Polyhedron,
+    Tetrahedron,
+)
+
+
+def test_extract_face_coords_uniform_faces():
+    tetra = Tetrahedron()
+    tetra.graph[0].shift([1, 0, 0])
+    face_coords = tetra.extract_face_coords()
+    assert face_coords.shape == (4, 3, 3)
+    for face, coords in zip(tetra.faces_list, face_coords):
+        for vertex, coord in zip(face, coords):
+            np.testing.assert_allclose(coord, tetra.graph[vertex].get_center())
+
+
+def test_extract_face_coords_ragged_faces():
+    pyramid = Polyhedron(
+        [[1, 1, 0], [1, -1, 0], [-1, -1, 0], [-1, 1, 0], [0, 0, 2]],
+        [[0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4], [0, 1, 2, 3]],
+    )
+    face_coords = pyramid.extract_face_coords()
+    assert [len(coords) for coords in face_coords] == [3, 3, 3, 3, 4]
+    np.testing.assert_allclose(face_coords[-1], pyramid.vertex_coords[:4])
+
+
+def test_dodecahedron_face_coords_shape():
+    assert Dodecahedron().extract_face_coords().shape == (12, 5, 3)
+
+
+def test_update_faces_in_place():
+    tetra = Tetrahedron()
+    faces = list(tetra.faces)
+    tetra.graph[0].shift([0, 0, 1])
+    tetra.update_faces(tetra)
+    assert list(tetra.faces) == faces
+    for face, indices in zip(tetra.faces, tetra.faces_list):
+        expected = [tetra.graph[i].get_center() for i in indices]
+        np.testing.assert_allclose(face.get_vertices(), expected)
+
+
+def test_get_edges_deduplicates_shared_edges():
+    assert len(Tetrahedron().edges) == 6
+    assert len(Icosahedron().edges) == 30
+    assert len(Dodecahedron().edges) == 30
+    assert all(a < b for a, b in Icosahedron().edges)
+
+
+def test_convex_hull_faces_wind_outwards():
+    points = np.array(
+        [
+            [-2.7, -0.6, 3.5],
+            [0.2, -1.7, -2.8],
+            [1.9, 1.2, 0.7],
+            [-2.7, 0.9, 1.9],
+            [1.6, 2.2, -4.2],
+        ]
+    )
+    hull = ConvexHull3D(*points)
+    vertices = hull.vertex_coords
+    center = vertices.mean(axis=0)
+    assert len(vertices) - len(hull.edges) + len(hull.faces_list) == 2
+    assert hull.face_normals.shape == (len(hull.faces_list), 3)
+    for face, face_normal in zip(hull.faces_list, hull.face_normals):
+        v0, v1, v2 = vertices[face[:3]]
+        normal = np.cross(v1 - v0, v2 - v0)
+        assert np.dot(normal, vertices[face].mean(axis=0) - center) > 0
+        assert np.dot(normal, face_normal) > 0
+
+
+def test_update_faces_skips_static_frames():
+    tetra = Tetrahedron()
+    tetra.update_faces(tetra)
+    points = tetra.faces[0].points
+    tetra.update_faces(tetra)
+    assert tetra.faces[0].points is points
+    tetra.graph[1].shift([0, 1, 0])
+    tetra.update_faces(tetra)
+    assert tetra.faces[0].points is not points
+
+
+def test_platonic_solid_from_prototype_matches_direct_construction():
+    octa = Octahedron(edge_length=3)
+    direct = Polyhedron(octa.vertex_coords, octa.faces_list)
+    np.testing.assert_allclose(octa.vertex_coords, direct.vertex_coords)
+    assert octa.edges == direct.edges
+    for face, direct_face in zip(octa.faces, direct.faces):
+        np.testing.assert_allclose(face.points, direct_face.points)
+    for v in octa.vertex_indices:
+        np.testing.assert_allclose(
+            octa.graph[v].get_center(), direct.graph[v].get_center()
+        )
+
+
+def test_platonic_solid_subclass_runs_its_own_init():
+    class ColoredTetrahedron(Tetrahedron):
+        def __init__(self, colors, **kwargs):
+            self.colors = colors
+            super().__init__(**kwargs)
+
+        def create_faces(self, face_coords):
+            faces = super().create_faces(face_coords)
+            for face, color in zip(faces, self.colors):
+                face.set_fill(color)
+            return faces
+
+    first = ColoredTetrahedron([RED] * 4)
+    second = ColoredTetrahedron([BLUE] * 4)
+    assert first.faces[0].get_fill_color() == RED
+    assert second.faces[0].get_fill_color() == BLUE
+
+
+def test_platonic_solids_from_prototype_are_independent():
+    a = Octahedron()
+    b = Octahedron()
+    assert a.graph is not b.graph
+    assert a.faces[0] is not b.faces[0]
+    a.graph[0].shift([1, 0, 0])
+    a.update(0)
+    np.testing.assert_allclose(b.graph[0].get_center(), b.vertex_coords[0])
+    np.testing.assert_allclose(a.graph[0].get_center(), a.vertex_coords[0] + [1, 0, 0])
+
+
+def test_polyhedron_without_graph():
+    ico = Icosahedron(edge_length=2, include_graph=False)
+    assert ico.graph is None
+    assert ico.get_updaters() == []
+    assert list(ico.submobjects) == [ico.faces]
+    np.testing.assert_allclose(
+        ico.extract_face_coords(), ico.vertex_coords[np.asarray(ico.faces_list)]
+    )
+
+
+def test_polyhedron_without_graph_follows_transformations():
+    tetra = Tetrahedron(include_graph=False)
+    tetra.shift([1, 2, 3])
+    np.testing.assert_allclose(
+        tetra.get_vertex_centers(), tetra.vertex_coords + [1, 2, 3]
+    )
+
+
+def test_convex_hull_keeps_faces_of_small_point_clouds():
+    rng = np.random.default_rng(0)
+    for scale in (1e-3, 3e-3):
+        hull = ConvexHull3D(*rng.normal(scale=scale, size=(30, 3)))
+        assert len(hull.faces_list) > 0
+        assert len(hull.vertex_coords) - len(hull.edges) + len(hull.faces_list) == 2